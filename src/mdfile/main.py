@@ -17,10 +17,11 @@ Configuration sources (lowest → highest precedence):
 5. CLI arguments
 """
 
-import sys
+import functools
 import json
 import os
 import pathlib
+import sys
 from importlib.metadata import version
 from typing import Optional, Any, Dict
 
@@ -70,7 +71,6 @@ def load_json_config(path: pathlib.Path | None = None) -> dict[str, Any]:
     if not path.exists():
         return {}
     with path.open("rt") as f:
-        #return json.load(f)
         return DottedDict(json.load(f))
 
 
@@ -87,15 +87,27 @@ def find_pyproject(start: pathlib.Path | None = None,
 
 
 
+@functools.lru_cache(maxsize=64)
+def _load_pyproject_section(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse [tool.mdfile] from a resolved pyproject.toml path.
+
+    mtime_ns and size are unused here; they key the cache so an edited file is parsed again.
+    """
+    with open(path_str, "rb") as f:
+        data = tomllib.load(f)
+    return data.get("tool", {}).get("mdfile", {})
+
+
 def load_pyproject_config(pyproject_file: pathlib.Path | None = None) -> dict[str, Any]:
     """Load [tool.mdfile] from pyproject.toml."""
     if pyproject_file is None:
         pyproject_file = find_pyproject()
     if pyproject_file is None or not pyproject_file.exists():
         return {}
-    with pyproject_file.open("rb") as f:
-        data = tomllib.load(f)
-    return data.get("tool", {}).get("mdfile", {})
+    path = pyproject_file.resolve()
+    st = path.stat()
+    # Callers only read and merge top-level keys; a shallow copy keeps the cached section intact.
+    return dict(_load_pyproject_section(str(path), st.st_mtime_ns, st.st_size))
 
 
 
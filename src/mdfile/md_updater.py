@@ -44,9 +44,8 @@ def update_markdown_from_string(content: str,
         str: The updated Markdown content with placeholders replaced.
     """
     try:
-        tokens = list(Tokenizer().tokenize(content))
-        validator = Validator()
-        validator.validate(tokens)
+        # Validate while tokenizing: one pass, no intermediate token list
+        Validator().validate(Tokenizer().tokenize(content))
 
         ignore = IgnoreBlocks()
 
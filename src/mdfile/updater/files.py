@@ -88,36 +88,37 @@ class BaseReplacer(ABC):
         Returns:
             str: Updated Markdown content with placeholders replaced.
         """
-        matches: list[re.Match[str]] = list(self.PLACEHOLDER_PATTERN.finditer(content))
-        new_content: str = content
-
-        for match in matches:
-            file_pattern: str = match.group(1).strip()
-            file_pattern =unquote(file_pattern)
-            old_block: str = match.group(0)
-
-            matching_files: list[pathlib.Path] = list(pathlib.Path().glob(file_pattern))
-
-            if matching_files:
-                # Generate Markdown for all matched files using a comprehension
-                markdown_parts: list[str] = [
-                    markdown_factory(
-                        str(file_path),
-                        bold_vals=self.bold_vals,
-                        auto_break=self.auto_break
-                    ).to_full_markdown()
-                    for file_path in matching_files
-                ]
-
-                replacement: str = self._format_success(
-                    file_pattern, "\n\n".join(markdown_parts)
-                )
-            else:
-                replacement = self._format_failure(file_pattern)
-
-            new_content = new_content.replace(old_block, replacement, 1)
-
-        return new_content
+        return self.PLACEHOLDER_PATTERN.sub(self._replace_match, content)
+
+    def _replace_match(self, match: re.Match[str]) -> str:
+        """
+        Build the replacement for a single placeholder match.
+
+        Args:
+            match (re.Match[str]): Placeholder match; group 1 holds the quoted glob pattern.
+
+        Returns:
+            str: Markdown for every matching file, or the failure block.
+        """
+        file_pattern: str = match.group(1).strip()
+        file_pattern =unquote(file_pattern)
+
+        matching_files: list[pathlib.Path] = list(pathlib.Path().glob(file_pattern))
+
+        if not matching_files:
+            return self._format_failure(file_pattern)
+
+        # Generate Markdown for all matched files using a comprehension
+        markdown_parts: list[str] = [
+            markdown_factory(
+                str(file_path),
+                bold_vals=self.bold_vals,
+                auto_break=self.auto_break
+            ).to_full_markdown()
+            for file_path in matching_files
+        ]
+
+        return self._format_success(file_pattern, "\n\n".join(markdown_parts))
 
 
 class FileReplacer(BaseReplacer):
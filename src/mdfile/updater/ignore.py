@@ -39,11 +39,13 @@ class IgnoreBlocks:
         self.ignores: list[str] = []
         # Create one unique token for this run
         self._token: str = f"IGNORE_{secrets.token_hex(8)}"
+        # Build the full placeholder once rather than on every access
+        self._full_token: str = f"{{{{{self._token}}}}}"
 
     @property
     def token(self) -> str:
         """Return the full {{IGNORE_xxx}} token string."""
-        return f"{{{{{self._token}}}}}"
+        return self._full_token
 
     def extract(self, content: str) -> str:
         """
@@ -80,8 +82,9 @@ class IgnoreBlocks:
         Raises:
             ValueError: If tokens are missing during restore.
         """
+        token = self._full_token
         for block in self.ignores:
-            if self.token not in content:
+            if token not in content:
                 raise ValueError("Missing token in content during restore")
-            content = content.replace(self.token, block, 1)
+            content = content.replace(token, block, 1)
         return content
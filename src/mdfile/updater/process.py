@@ -8,8 +8,10 @@ Handles timeouts gracefully using Rich formatting.
 """
 
 import io
+import os
 import re
 import shlex
+import signal
 import subprocess
 from abc import ABC, abstractmethod
 from typing import ClassVar
@@ -20,26 +22,74 @@ from rich.panel import Panel
 from updater.str_utils import unquote
 
 
+def _run_command(args: list[str], timeout_sec: float) -> str:
+    """
+    Run a command and return its standard output.
+
+    The command runs in its own session (process group on POSIX), so on timeout
+    the whole group is killed, including any children it spawned, rather than
+    leaving them running after the direct child is gone.  The same cleanup runs
+    if waiting is interrupted (e.g. KeyboardInterrupt), since a terminal Ctrl-C
+    never reaches a command in its own session.
+
+    Args:
+        args (list[str]): Command and arguments to execute.
+        timeout_sec (float): Maximum seconds to wait for the command.
+
+    Returns:
+        str: Captured standard output.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command does not finish in time.
+        subprocess.CalledProcessError: If the command exits with a non-zero status.
+    """
+    with subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=True,
+    ) as proc:
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout_sec)
+        except BaseException:
+            if hasattr(os, "killpg"):
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            else:
+                proc.kill()
+            proc.communicate()
+            raise
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, args, stdout, stderr)
+    return stdout
+
+
 class BaseProcessReplacer(ABC):
     """
     Base class for replacing process placeholders with command output.
 
     Subclasses must define:
       * PLACEHOLDER_PATTERN: Regex pattern to locate placeholders.
+      * SENTINEL: Literal text every placeholder starts with, used to skip the
+        regex entirely for content without any.
       * _format_success: Method to format output on successful execution.
       * _format_timeout: Method to format output on timeout.
     """
 
     PLACEHOLDER_PATTERN: ClassVar[re.Pattern[str]]
+    SENTINEL: ClassVar[str]
 
-    def __init__(self, timeout_sec: int = 30) -> None:
+    def __init__(self, timeout_sec: float = 30) -> None:
         """
         Initialize a base process replacer.
 
         Args:
-            timeout_sec (int): Maximum seconds to wait for command execution.
+            timeout_sec (float): Maximum seconds to wait for command execution.
         """
-        self.timeout_sec: int = timeout_sec
+        self.timeout_sec: float = timeout_sec
 
     @abstractmethod
     def _format_success(self, command: str, output: str) -> str:
@@ -79,32 +129,28 @@ class BaseProcessReplacer(ABC):
         Returns:
             str: Updated content with command outputs inserted.
         """
-        matches: list[re.Match[str]] = list(self.PLACEHOLDER_PATTERN.finditer(content))
-        new_content: str = content
+        if self.SENTINEL not in content:
+            return content
 
-        for match in matches:
+        # Collect untouched text and replacement blocks, joined once at the end
+        parts: list[str] = []
+        last_end: int = 0
+
+        for match in self.PLACEHOLDER_PATTERN.finditer(content):
             command: str = match.group(1).strip()
             command = unquote(command)
-            old_block: str = match.group(0)
 
             string_io = io.StringIO()
             console = Console(file=string_io, width=100, highlight=False)
 
             try:
                 args: list[str] = shlex.split(command)
-                result = subprocess.run(
-                    args,
-                    capture_output=True,
-                    shell=False,
-                    text=True,
-                    check=True,
-                    timeout=self.timeout_sec,
-                )
-                console.print(result.stdout.strip())
+                stdout: str = _run_command(args, self.timeout_sec)
+                console.print(stdout.strip())
                 output: str = string_io.getvalue()
                 new_block: str = self._format_success(command, output)
 
-            except subprocess.TimeoutExpired:
+            except BaseException:
                 console.print(
                     Panel.fit(
                         f"Command execution timed out after {self.timeout_sec} seconds",
@@ -115,9 +161,14 @@ class BaseProcessReplacer(ABC):
                 output = string_io.getvalue()
                 new_block = self._format_timeout(command, output)
 
-            new_content = new_content.replace(old_block, new_block, 1)
+            parts.append(content[last_end:match.start()])
+            parts.append(new_block)
+            last_end = match.end()
 
-        return new_content
+        if not parts:
+            return content
+        parts.append(content[last_end:])
+        return "".join(parts)
 
 
 class ProcessReplacer(BaseProcessReplacer):
@@ -132,6 +183,7 @@ class ProcessReplacer(BaseProcessReplacer):
     PLACEHOLDER_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
         r"\{\{process\s+(.+?)\}\}", re.DOTALL
     )
+    SENTINEL: ClassVar[str] = "{{process"
 
     def _format_success(self, command: str, output: str) -> str:
         """Format successful command output as inline Markdown code block."""
@@ -164,6 +216,7 @@ class ProcessBlockReplacer(BaseProcessReplacer):
         r"^<!--process\s+(.+?)-->(.*?)<!--process end-->",
         re.DOTALL | re.MULTILINE,
     )
+    SENTINEL: ClassVar[str] = "<!--process"
 
     def _format_success(self, command: str, output: str) -> str:
         """Format successful command output as a full block with markers."""
@@ -180,11 +233,12 @@ class ShellReplacer(BaseProcessReplacer):
     PLACEHOLDER_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
         r"\{\{shell\s+(.+?)\}\}", re.DOTALL
     )
+    SENTINEL: ClassVar[str] = "{{shell"
 
-    def __init__(self, timeout_sec: int = 30, lang: str = "bash") -> None:
+    def __init__(self, timeout_sec: float = 30, lang: str = "bash") -> None:
         """
         Args:
-            timeout_sec (int): Maximum seconds to wait for command execution.
+            timeout_sec (float): Maximum seconds to wait for command execution.
             lang (str): Markdown identifier for the code block (default 'bash').
         """
         super().__init__(timeout_sec)
@@ -204,11 +258,12 @@ class ShellBlockReplacer(BaseProcessReplacer):
         r"^<!--shell\s+(.+?)-->(.*?)<!--shell end-->",
         re.DOTALL | re.MULTILINE,
     )
+    SENTINEL: ClassVar[str] = "<!--shell"
 
-    def __init__(self, timeout_sec: int = 30, lang: str = "bash") -> None:
+    def __init__(self, timeout_sec: float = 30, lang: str = "bash") -> None:
         """
         Args:
-            timeout_sec (int): Maximum seconds to wait for command execution.
+            timeout_sec (float): Maximum seconds to wait for command execution.
             lang (str): Markdown identifier for the code block (default 'bash').
         """
         super().__init__(timeout_sec)
@@ -1,6 +1,8 @@
 from typing import Optional
 
-from typing import Optional
+# Opening quote character -> its triple-quote form
+_TRIPLE_QUOTES = {'"': '"""', "'": "'''"}
+
 
 def unquote(command: Optional[str]) -> Optional[str]:
     """
@@ -28,26 +30,25 @@ def unquote(command: Optional[str]) -> Optional[str]:
     if not command:
         raise ValueError("Empty string is not properly quoted")
 
+    # Dispatch once on the length and the first character
+    n = len(command)
+    quote = command[0]
+    if n < 2 or quote not in _TRIPLE_QUOTES or command[-1] != quote:
+        raise ValueError(f"String is not properly quoted: {command}")
+    if n == 2:
+        return ""
+
     # Check for triple quotes first (they take precedence)
-    for quote in ['"""', "'''"]:
-        if len(command) >= 2 * len(quote) and command.startswith(quote) and command.endswith(quote):
-            content = command[len(quote):-len(quote)]
-            # Check for unescaped quotes in the content
-            if quote in content:
-                raise ValueError(f"String has unescaped quotes within content: {command}")
-            return content
-
-    # Check for regular quotes
-    for quote in  ['"', "'"]:
-        if len(command) >= 2 and command.startswith(quote) and command.endswith(quote):
-            content = command[1:-1]
-            # Check for unescaped quotes in the content
-            i = 0
-            while i < len(content):
-                if content[i] == quote[0] and (i == 0 or content[i - 1] != '\\'):
-                    raise ValueError(f"String has unescaped quotes within content: {command}")
-                i += 1
-            return content
-
-    # If we got here, it's not properly quoted
-    raise ValueError(f"String is not properly quoted: {command}")
+    if n >= 6 and command[1] == command[2] == command[-2] == command[-3] == quote:
+        # Check for unescaped quotes in the content, searched in place
+        if command.find(_TRIPLE_QUOTES[quote], 3, n - 3) != -1:
+            raise ValueError(f"String has unescaped quotes within content: {command}")
+        return command[3:-3]
+
+    # Regular quotes: jump between quote characters in the content, which must be escaped
+    i = command.find(quote, 1, n - 1)
+    while i != -1:
+        if i == 1 or command[i - 1] != '\\':
+            raise ValueError(f"String has unescaped quotes within content: {command}")
+        i = command.find(quote, i + 1, n - 1)
+    return command[1:-1]
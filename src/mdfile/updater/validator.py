@@ -3,6 +3,19 @@ from dataclasses import dataclass
 from typing import Optional, Iterator,Iterable
 
 
+# Compiled once at import; shared by every Tokenizer using the default grammar.
+_TAG_RE = re.compile(r"""
+    ^\s*<!--\s*                                      # HTML opener
+    (?:
+        (?P<start>(shell|file|process))\s+(?P<cmd>(?:"[^"]*"|'[^']*'))\s*  # start with command (quotes included)
+      | (?P<ignore_start>ignore)\s*                                         # ignore start
+      | (?P<end>(shell|file|process))\s+end\s*                             # end
+      | (?P<ignore_end>ignore)\s+end\s*                                    # ignore end
+    )
+    -->\s*$                                          # HTML closer
+    """, re.VERBOSE)
+
+
 @dataclass
 class Token:
     """Represents a parsed tag or text line from Markdown-like input."""
@@ -15,26 +28,36 @@ class Token:
 class Tokenizer:
     """Convert markdown-like tags into a stream of Token objects."""
 
-    TAG_RE = r"""
-        ^\s*<!--\s*                                      # HTML opener
-        (?:
-            (?P<start>(shell|file|process))\s+(?P<cmd>(?:"[^"]*"|'[^']*'))\s*  # start with command (quotes included)
-          | (?P<ignore_start>ignore)\s*                                         # ignore start
-          | (?P<end>(shell|file|process))\s+end\s*                             # end
-          | (?P<ignore_end>ignore)\s+end\s*                                    # ignore end
-        )
-        -->\s*$                                          # HTML closer
-        """
+    TAG_RE = _TAG_RE.pattern
 
     def __init__(self,grammar:str|None=None) -> None:
-        self.grammar=re.compile(self.TAG_RE or grammar,re.VERBOSE)
+        if grammar is None:
+            grammar = self.TAG_RE
+        # Reuse the precompiled default unless a caller or subclass supplied its own grammar.
+        self.grammar = _TAG_RE if grammar == _TAG_RE.pattern else re.compile(grammar, re.VERBOSE)
 
     def tokenize(self, text: str) -> Iterator[Token]:
         """
         Yield Token objects for each recognized tag or text line.
         """
-        for lineno, line in enumerate(text.splitlines() or [""], start=1):
-            m = self.grammar.match(line)
+        lines = text.splitlines() or [""]
+
+        # Under the default grammar a document without any HTML comment has no
+        # tags: skip the per-line checks.
+        if self.grammar is _TAG_RE and "<!--" not in text:
+            for lineno, line in enumerate(lines, start=1):
+                yield Token("TEXT", "text", line, lineno)
+            return
+
+        grammar = self.grammar
+        # The prefilter knows the default grammar's opener; custom grammars may use another.
+        prefilter = grammar is _TAG_RE
+        for lineno, line in enumerate(lines, start=1):
+            # Most lines are plain text; only lines opening an HTML comment can be tags.
+            if prefilter and ("<!--" not in line or not line.lstrip().startswith("<!--")):
+                yield Token("TEXT", "text", line, lineno)
+                continue
+            m = grammar.match(line)
             if m:
                 if m.group("start"):
                     yield Token("START", m.group("start"), m.group("cmd"), lineno)
@@ -68,8 +91,17 @@ class Validator:
         raise ValueError(msg)
 
     def validate(self, tokens: Iterable[Token]) -> bool:
-        """Validate the token stream, raising ValueError on first structural error."""
+        """Validate the token stream, raising ValueError on first structural error.
+
+        Tokens are consumed in a single pass, so a lazy Tokenizer.tokenize()
+        generator can be passed directly and stops at the first error.
+        Block state is reset on entry, so one Validator can check many streams.
+        """
+        self.current_block = None
+        self.start_line = 0
         for token in tokens:
+            if token.kind == "TEXT":
+                continue
             if token.kind == "START":
                 if self.current_block:
                     self.raise_error(
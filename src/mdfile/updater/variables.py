@@ -1,7 +1,25 @@
 import datetime as dt
+import functools
 import importlib.metadata
 import os
 import re
+from typing import ClassVar
+
+
+@functools.lru_cache(maxsize=None)
+def _package_metadata(package: str):
+    """
+    Read and parse a package's metadata once per process.
+
+    Returns:
+        The metadata message and its fields as a dict, or (None, {}) if the
+        package is not installed.  Callers must not mutate the dict.
+    """
+    try:
+        msg = importlib.metadata.metadata(package)
+    except importlib.metadata.PackageNotFoundError:
+        return None, {}
+    return msg, dict(msg)
 
 
 class PackageAccessor:
@@ -10,20 +28,19 @@ class PackageAccessor:
     def __init__(self, package: str) -> None:
         self._package: str = package
         self._pkg_meta: dict[str, str] | None = None
+        self._pkg_msg = None
 
     def _load_metadata(self) -> None:
+        """Fetch the (process-wide cached) package metadata on first use."""
         if self._pkg_meta is None:
-            try:
-                self._pkg_meta = dict(importlib.metadata.metadata(self._package))
-            except importlib.metadata.PackageNotFoundError:
-                self._pkg_meta = {}
+            self._pkg_msg, self._pkg_meta = _package_metadata(self._package)
 
     def __getattr__(self, field: str) -> str:
         self._load_metadata()
         key: str = field.replace("_", "-")
         if not self._pkg_meta:
             return ""
-        all_vals = importlib.metadata.metadata(self._package).get_all(key)
+        all_vals = self._pkg_msg.get_all(key)
         if all_vals:
             return ", ".join(all_vals)
         return self._pkg_meta.get(key, "")
@@ -46,14 +63,25 @@ class PackageAccessor:
         return "\n".join([header] + rows)
 
 
+# Replacement text for a variable that cannot be resolved
+_ERR_TMPL = "(ERROR: Variable `%s` not found)"
+
+# {{$name}} placeholder, compiled once for every VariableReplacer
+_VAR_RE: re.Pattern[str] = re.compile(r"\{\{\s*\$([a-zA-Z][a-zA-Z0-9_.]*)\s*\}\}")
+
+
 class VariableReplacer:
     """Replace {{$var}} placeholders with vars, environment, or package metadata."""
 
+    PLACEHOLDER_PATTERN: ClassVar[re.Pattern[str]] = _VAR_RE
+
     def __init__(self, extra_vars: dict[str, str] | None = None) -> None:
         """Initialize with default date/time vars and optional extra variables."""
+        # One clock read for both, so date and time always agree
+        now: dt.datetime = dt.datetime.now()
         self.vars: dict[str, str] = {
-            "date": dt.datetime.now().strftime("%Y-%m-%d"),
-            "time": dt.datetime.now().strftime("%H:%M:%S"),
+            "date": now.date().isoformat(),
+            "time": now.time().isoformat(timespec="seconds"),
         }
 
         if extra_vars is not None:
@@ -62,16 +90,16 @@ class VariableReplacer:
         # Dictionary of PackageAccessor objects for caching
         self._packages: dict[str, PackageAccessor] = {}
 
+        # Package metadata doesn't change within a process, so meta lookups are cached
+        # across update() calls.  ENV and self.vars lookups are not: both may change.
+        self._resolve_meta_variable = functools.lru_cache(maxsize=128)(self._resolve_meta_variable)
+
     def _get_package_accessor(self, package: str) -> PackageAccessor:
         """Return cached PackageAccessor for package, create if needed."""
         if package not in self._packages:
             self._packages[package] = PackageAccessor(package)
         return self._packages[package]
 
-    @property
-    def PLACEHOLDER_PATTERN(self) -> re.Pattern[str]:
-        return re.compile(r'\{\{\s*\$([a-zA-Z][a-zA-Z0-9_.]*)\s*\}\}')
-
     def update(self, content: str) -> str:
         """
         Replace all {{$var}} placeholders in the content with their values.
@@ -100,24 +128,38 @@ class VariableReplacer:
         Returns:
             String with all placeholders replaced by their values or error messages
         """
-        return self.PLACEHOLDER_PATTERN.sub(self._resolve_variable, content)
+        # Every placeholder contains "{{$"; skip the regex when there is none
+        if "{{" not in content or "$" not in content:
+            return content
 
-    def _resolve_variable(self, match: re.Match[str]) -> str:
+        pattern: re.Pattern[str] = self.PLACEHOLDER_PATTERN
+
+        # Resolve each distinct name once, in order of first use, then substitute from the table
+        values: dict[str, str] = {
+            name: self._resolve_name(name) for name in dict.fromkeys(pattern.findall(content))
+        }
+        return pattern.sub(lambda match: values[match.group(1)], content)
+
+    def _resolve_name(self, var_name: str) -> str:
         """
-        Resolve a single variable placeholder match to its value.
+        Resolve a variable name to its value.
 
         Args:
-            match: Regular expression match object containing the variable name
+            var_name: Variable name without the surrounding {{$ }}
 
         Returns:
             String representation of the variable value or error message
         """
-        var_name: str = match.group(1)
-
         # Block sensitive keys
         if self._is_sensitive(var_name):
             return f"ERROR: Variable {var_name} blocked."
 
+        # Plain names (no dot) can only come from self.vars
+        if "." not in var_name:
+            if var_name in self.vars:
+                return str(self.vars[var_name])
+            return _ERR_TMPL % var_name
+
         # Dispatch to appropriate resolver based on variable prefix
         if var_name.startswith("ENV."):
             return self._resolve_env_variable(var_name)
@@ -126,7 +168,7 @@ class VariableReplacer:
         elif var_name in self.vars:
             return str(self.vars[var_name])
 
-        return f"(ERROR: Variable `{var_name}` not found)"
+        return _ERR_TMPL % var_name
 
     def _resolve_env_variable(self, var_name: str) -> str:
         """
@@ -139,7 +181,8 @@ class VariableReplacer:
             Value from environment or error message
         """
         env_key: str = var_name[4:]
-        return os.environ.get(env_key, f"(ERROR: Variable `{var_name}` not found)")
+        value: str | None = os.environ.get(env_key)
+        return _ERR_TMPL % var_name if value is None else value
 
     def _resolve_meta_variable(self, var_name: str) -> str:
         """
@@ -13,9 +13,17 @@ NOTE: This module ENFORCES string keys for all operations.
 """
 
 
-from collections.abc import Mapping
+import copy
+from collections.abc import Iterable, Mapping
 from typing import Any
 
+# Prefix of the TypeError raised for non-string keys; the offending type name
+# is appended only when the error is actually raised.
+_NON_STRING_KEY_ERR = "DottedDict only accepts string keys, got "
+
+# Sentinel for lookups where None is a legitimate stored value.
+_MISSING = object()
+
 
 class DottedDict(dict):
     """
@@ -57,30 +65,50 @@ class DottedDict(dict):
         # Initialize as an empty dict
         super().__init__()
 
-        # Use update to handle both dict and iterable of pairs
+        # Mappings are ingested in place; anything else is an iterable of pairs
         if mapping is not None:
-            self.update(mapping)
+            if isinstance(mapping, Mapping):
+                self._ingest_mapping(mapping)
+            else:
+                for k, v in mapping:
+                    self[k] = v
 
         # Add items from kwargs
         if kwargs:
-            self.update(kwargs)
+            self._ingest_mapping(kwargs)
+
+    @staticmethod
+    def _check_str(key: Any) -> None:
+        """Raise TypeError unless key is a plain str."""
+        if type(key) is not str:
+            raise TypeError(_NON_STRING_KEY_ERR + type(key).__name__)
+
+    def _ingest_mapping(self, m: Mapping) -> None:
+        """Copy m into self, converting nested dicts in place.
+
+        Plain keys are written straight into the underlying dict and nested
+        dicts are filled directly rather than built separately and copied in.
+        Dotted keys still go through __setitem__ so they expand into nesting.
+        """
+        for k, v in m.items():
+            DottedDict._check_str(k)
+            if "." in k:
+                self[k] = v
+            elif isinstance(v, dict) and not isinstance(v, DottedDict):
+                child = DottedDict.__new__(DottedDict)
+                dict.__setitem__(self, k, child)
+                child._ingest_mapping(v)
+            else:
+                dict.__setitem__(self, k, v)
 
     def _convert_dict(self, d: dict) -> 'DottedDict':
         """Convert a regular dict to DottedDict, including nested dicts."""
         result = DottedDict()
-        for k, v in d.items():
-            if not isinstance(k, str):
-                raise TypeError(f"DottedDict only accepts string keys, got {type(k)}")
-            if isinstance(v, dict) and not isinstance(v, DottedDict):
-                result[k] = self._convert_dict(v)
-            else:
-                result[k] = v
+        result._ingest_mapping(d)
         return result
 
     def __setitem__(self, key: str, value: Any) -> None:
-        # Validate key is a string
-        if not isinstance(key, str):
-            raise TypeError(f"DottedDict only accepts string keys, got {type(key)}")
+        DottedDict._check_str(key)
 
         # Convert dict values to DottedDict
         if isinstance(value, dict) and not isinstance(value, DottedDict):
@@ -90,19 +118,22 @@ class DottedDict(dict):
             super().__setitem__(key, value)
             return
 
+        # setdefault probes and stores in one call; anything that is not already
+        # a dict (missing, or a leaf value) is replaced with a fresh DottedDict.
         parts = key.split(".")
         current: Any = self
         for part in parts[:-1]:
-            if part not in current or not isinstance(current[part], dict):
-                current[part] = DottedDict()
-            current = current[part]
+            child = dict.setdefault(current, part, None)
+            if not isinstance(child, dict):
+                child = DottedDict()
+                dict.__setitem__(current, part, child)
+            current = child
 
-        current[parts[-1]] = value
+        dict.__setitem__(current, parts[-1], value)
 
     def __contains__(self, key: str) -> bool:
         """Support containment check with dotted notation."""
-        if not isinstance(key, str):
-            raise TypeError(f"DottedDict only accepts string keys, got {type(key)}")
+        DottedDict._check_str(key)
 
         if "." not in key:
             return super().__contains__(key)
@@ -114,19 +145,30 @@ class DottedDict(dict):
             return False
 
     def __getitem__(self, key: str) -> Any:
-        # Validate key is a string
-        if not isinstance(key, str):
-            raise TypeError(f"DottedDict only accepts string keys, got {type(key)}")
+        DottedDict._check_str(key)
 
         if "." not in key:
             return super().__getitem__(key)
 
-        current: Any = self
+        # Nested dicts are always DottedDicts, so walk with the raw dict lookup.
+        # A missing part is reported as the full dotted key being missing.
+        try:
+            current: Any = self
+            for part in key.split("."):
+                current = dict.__getitem__(current, part)
+            return current
+        except KeyError:
+            raise KeyError(key) from None
+        except TypeError:
+            # A non-dict intermediate: other Mappings are stored unconverted,
+            # so walk again with generic Mapping access.
+            pass
+
+        current = self
         for part in key.split("."):
-            if isinstance(current, Mapping) and part in current:
-                current = current[part]
-            else:
+            if not isinstance(current, Mapping) or part not in current:
                 raise KeyError(key)
+            current = current[part]
         return current
 
     def get(self, key, default=None):
@@ -142,20 +184,88 @@ class DottedDict(dict):
         Raises:
             TypeError: If key is not a string
         """
-        # Validate key is a string first
-        if not isinstance(key, str):
-            raise TypeError(f"DottedDict only accepts string keys, got {type(key)}")
+        DottedDict._check_str(key)
 
-        try:
-            return self[key]
-        except KeyError:
-            return default
+        # Walk with dict.get and a sentinel so misses never raise internally;
+        # other Mappings are stored unconverted and use their own get
+        current: Any = self
+        for part in key.split("."):
+            if isinstance(current, dict):
+                current = dict.get(current, part, _MISSING)
+            elif isinstance(current, Mapping):
+                current = current.get(part, _MISSING)
+            else:
+                return default
+            if current is _MISSING:
+                return default
+        return current
+
+    def get_many(self, paths: Iterable[str], default: Any = None) -> dict[str, Any]:
+        """Look up several dotted keys at once, walking shared prefixes only once.
+
+        The paths are merged into a prefix tree, so ``db.host`` and ``db.port``
+        share the single lookup of ``db``.
+
+        Args:
+            paths: Dotted keys to look up (each must be a string)
+            default: Value used for any path that is not found
+
+        Returns:
+            Dict mapping each requested path to its value or default,
+            in the order the paths were given
+
+        Raises:
+            TypeError: If any path is not a string
+        """
+        paths = list(paths)
+
+        # Build a prefix tree of path segments; the None key marks the end of a path
+        trie: dict = {}
+        for path in paths:
+            DottedDict._check_str(path)
+            node = trie
+            for part in path.split("."):
+                node = node.setdefault(part, {})
+            node[None] = path
+
+        # Walk the data and the tree together; misses propagate as _MISSING
+        found: dict[str, Any] = {}
+        stack: list[tuple[Any, dict]] = [(self, trie)]
+        while stack:
+            current, node = stack.pop()
+            for part, sub in node.items():
+                if part is None:
+                    continue
+                if isinstance(current, dict):
+                    child = dict.get(current, part, _MISSING)
+                elif isinstance(current, Mapping):
+                    child = current.get(part, _MISSING)
+                else:
+                    child = _MISSING
+                if None in sub:
+                    found[sub[None]] = child
+                stack.append((child, sub))
+
+        return {path: default if found[path] is _MISSING else found[path] for path in paths}
 
     def update(self, *args, **kwargs):
         d = dict()
         d.update(*args, **kwargs)
         for k, v in d.items():
-            if not isinstance(k, str):
-                raise TypeError(f"DottedDict only accepts string keys, got {type(k)}")
+            DottedDict._check_str(k)
             self[k] = v  # Use __setitem__ to handle conversion
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'DottedDict':
+        """Deep copy without going through the generic reduce/reconstruct path.
+
+        The copy keeps the subclass and its instance attributes.  Values go
+        through copy.deepcopy with the shared memo, so shared and cyclic
+        references are copied once and kept shared in the result.
+        """
+        cls = type(self)
+        new = cls.__new__(cls)
+        memo[id(self)] = new
+        for k, v in dict.items(self):
+            dict.__setitem__(new, k, copy.deepcopy(v, memo))
+        new.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        return new
@@ -0,0 +1,73 @@
+import functools
+import pathlib
+
+import pytest
+from typer.testing import CliRunner
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: long-running tests, only run when selected with -m slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow unless the -m expression asks for them."""
+    if "slow" in (config.getoption("markexpr") or ""):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test; select with -m slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+# Directory holding this conftest; relative fixture paths are resolved against it
+TEST_DIR = pathlib.Path(__file__).resolve().parent
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_read(path: str) -> str:
+    """Read a static fixture file once per session, keyed by its path."""
+    return (TEST_DIR / path).read_text(encoding="utf-8")
+
+
+def _read_fixture_pair(
+                md_file: str,
+                output_file: str,
+                input_folder: str = "input",
+                output_folder: str = "output",
+) -> tuple[str, str]:
+    """Return (content, expected) for an input Markdown file and its expected output."""
+    content = _cached_read(str(pathlib.Path(input_folder) / md_file))
+    expected = _cached_read(str(pathlib.Path(output_folder) / output_file))
+
+    return content, expected
+
+
+@pytest.fixture(scope="session")
+def file_setup():
+    """
+    Loader returning (content, expected) for an input/output Markdown fixture pair.
+
+    The files under input/ and output/ are static, so each file is read from disk
+    only once per test session, even when it appears in several pairs.
+    """
+    return _read_fixture_pair
+
+
+@pytest.fixture(scope="session")
+def cached_read():
+    """Session-cached reader for static files under input/ and output/."""
+    return _cached_read
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Typer CLI runner shared by the whole session."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def json_config_dir(tmp_path_factory) -> pathlib.Path:
+    """Directory holding an empty mdfile.json, written once per session."""
+    config_dir = tmp_path_factory.mktemp("json_config")
+    (config_dir / "mdfile.json").write_text("{}")
+    return config_dir
@@ -1,4 +1,5 @@
 import copy
+import types
 import pytest
 from util.dotted_dict import DottedDict  # replace with the actual import
 
@@ -260,6 +261,45 @@ def test_deep_copy():
     assert d2["b.c"] == [1, 2, 3]
 
 
+def test_deep_copy_keeps_cycles():
+    """A DottedDict that contains itself copies to a DottedDict that contains the copy."""
+    d1 = DottedDict({"a": 1})
+    d1["self"] = d1
+    d2 = copy.deepcopy(d1)
+
+    assert d2 is not d1
+    assert d2["self"] is d2
+    assert d2["a"] == 1
+
+
+def test_deep_copy_keeps_shared_references():
+    """Two keys pointing at the same nested DottedDict still share one copy."""
+    shared = DottedDict({"x": 1})
+    d1 = DottedDict()
+    d1["a"] = shared
+    d1["b"] = shared
+    d2 = copy.deepcopy(d1)
+
+    assert d2["a"] is d2["b"]
+    assert d2["a"] is not shared
+
+
+def test_deep_copy_keeps_subclass_and_attributes():
+    """Subclasses and their instance attributes survive a deep copy."""
+
+    class TaggedDict(DottedDict):
+        pass
+
+    d1 = TaggedDict({"a": {"b": 1}})
+    d1.tags = ["x"]
+    d2 = copy.deepcopy(d1)
+
+    assert type(d2) is TaggedDict
+    assert d2.tags == ["x"]
+    assert d2.tags is not d1.tags
+    assert d2["a.b"] == 1
+
+
 # Container behavior tests
 def test_iteration():
     """Test iteration over keys."""
@@ -276,6 +316,26 @@ def test_contains():
     assert "missing" not in d
 
 
+def test_getitem_through_nested_mapping():
+    """Test dotted access walks into nested Mappings that are not dicts."""
+    d = DottedDict({"a": types.MappingProxyType({"b": 1}), "x": 1})
+    assert d["a.b"] == 1
+    assert "a.b" in d
+    assert "a.c" not in d
+    assert "x.y" not in d
+    with pytest.raises(KeyError):
+        d["a.c"]
+
+
+def test_get_through_nested_mapping():
+    """Test get walks into nested Mappings that are not dicts."""
+    d = DottedDict({"a": types.MappingProxyType({"b": 1, "n": None}), "x": 1})
+    assert d.get("a.b") == 1
+    assert d.get("a.n", "default") is None
+    assert d.get("a.c", "default") == "default"
+    assert d.get("x.y", "default") == "default"
+
+
 # Update method tests
 def test_update_with_dict():
     """Test update with a dictionary."""
@@ -368,3 +428,36 @@ def test_keys_with_multiple_dots():
     d["x.y.z"] = "multi-dots"
     assert d.get("x.y.z") == "multi-dots"
     assert d["x"]["y"]["z"] == "multi-dots"
+
+
+def test_get_many():
+    """Test batched lookups share prefixes and fill in defaults for misses."""
+    d = DottedDict({"db": {"host": "localhost", "port": 5432, "opts": None}, "name": "app", "x": 1})
+    result = d.get_many(["db.host", "db.port", "db.opts", "db.user", "name", "x.y", "db"], "dflt")
+    assert result == {
+        "db.host": "localhost",
+        "db.port": 5432,
+        "db.opts": None,
+        "db.user": "dflt",
+        "name": "app",
+        "x.y": "dflt",
+        "db": d["db"],
+    }
+    assert list(result) == ["db.host", "db.port", "db.opts", "db.user", "name", "x.y", "db"]
+    assert d.get_many([]) == {}
+
+
+def test_get_many_through_nested_mapping():
+    """Test get_many agrees with get for nested Mappings that are not dicts."""
+    d = DottedDict({"a": types.MappingProxyType({"b": 1, "c": {"d": 2}}), "x": 1})
+    paths = ["a.b", "a.c.d", "a.e", "x.y"]
+    assert d.get_many(paths, "dflt") == {"a.b": 1, "a.c.d": 2, "a.e": "dflt", "x.y": "dflt"}
+    assert d.get_many(paths, "dflt") == {p: d.get(p, "dflt") for p in paths}
+
+
+@pytest.mark.parametrize("non_string_key", NON_STRING_KEYS[:3])
+def test_get_many_rejects_non_string_keys(non_string_key):
+    """Test that get_many rejects non-string paths."""
+    d = DottedDict({"a": 1})
+    with pytest.raises(TypeError):
+        d.get_many(["a", non_string_key])
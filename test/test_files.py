@@ -1,107 +1,47 @@
 import pytest
 import pathlib
-import tempfile
 from md_updater import update_markdown_from_string,update_markdown_file
 from updater.files import FileReplacer,FileBlockInsertReplacer
 
-def file_setup(
-                md_file:str,
-                output_file:str,
-                input_folder="input",
-                output_folder="output",
-):
-    input_md_file = pathlib.Path(input_folder) / md_file
-    output_md_file = pathlib.Path(output_folder) / output_file
+# Fixture paths are relative to this directory, not the working directory
+TEST_DIR = pathlib.Path(__file__).resolve().parent
 
-    content = input_md_file.read_text()
-    expected = output_md_file.read_text()
 
-    return content, expected
+@pytest.fixture(scope="module")
+def default_replacer():
+    """One FileBlockInsertReplacer shared by tests; update() does not mutate it."""
+    return FileBlockInsertReplacer(bold='', auto_break=False)
 
 
-def test_update_proc_insert():
+def test_update_proc_insert(file_setup):
     content, expected = file_setup("example_proc_insert.md", "example_proc_insert.md")
     result = update_markdown_from_string(content, bold="", auto_break=False)
     assert result == expected
 
-def test_update_markdown_csv_file():
-    """
-    Test the update_markdown_file function using actual Markdown and CSV files.
-    """
-    # Use file_setup helper to get content and expected values
-    content, expected_output = file_setup(
-        md_file="example.md",
-        output_file="example_output.md",
-        input_folder="input",
-        output_folder="output"
-    )
-
-    result = FileBlockInsertReplacer().update(content)
-
-    # Assert that the result matches the expected output
-    assert expected_output == result, f"Output did not match:\n{result}"
-
-def test_update_file_insert():
+def test_update_file_insert(file_setup):
     content, expected = file_setup("example_python_insert.md", "example_python_insert.md")
     result = FileReplacer().update(content)
     assert result == expected
 
-def test_update_markdown_csv_numbers_file():
-    """
-    Test the update_markdown_file function using actual Markdown and CSV files.
-    """
-
-    # Use file_setup helper to get content and expected values
-    content, expected_output = file_setup(
-        md_file="example_numbers.md",
-        output_file="example_output_numbers.md",
-        input_folder="input",
-        output_folder="output"
-    )
-
-    # Call the function, processing Markdown with placeholders
-    result = FileBlockInsertReplacer(bold=False, auto_break=False).update(content)
-
-    # Assert that the result matches the expected output
-    assert expected_output == result, f"Output did not match:\n{result}"
-
-def test_update_markdown_csv_br_file():
-    """
-    Test the update_markdown_file function using actual Markdown and CSV files.
-    """
-
-    # Use file_setup helper to get content and expected values
-    content, expected_output = file_setup(
-        md_file="example.md",
-        output_file="example_output_br.md",
-        input_folder="input",
-        output_folder="output"
-    )
-
-    # Call the function, processing Markdown with placeholders
-    result = FileBlockInsertReplacer(bold=False, auto_break=True).update(content)
-
-    # Assert that the result matches the expected output
-    assert expected_output == result, f"Output did not match:\n{result}"
-
-def test_update_markdown_python_file():
+@pytest.mark.parametrize("md_name, expected_name, bold, auto_break", [
+    ("example.md", "example_output.md", None, False),
+    ("example_numbers.md", "example_output_numbers.md", False, False),
+    ("example.md", "example_output_br.md", False, True),
+    ("example_python.md", "example_python.md", '', False),
+], ids=["csv", "csv_numbers", "csv_br", "python"])
+def test_update_markdown_block_file(md_name, expected_name, bold, auto_break,
+                                    file_setup):
     """
-    Test the update_markdown_file function using actual Markdown and Python files.
+    Test FileBlockInsertReplacer using actual Markdown files that insert CSV and Python files.
     """
-
     # Use file_setup helper to get content and expected values
-    content, expected_output = file_setup(
-        md_file="example_python.md",
-        output_file="example_python.md",
-        input_folder="input",
-        output_folder="output"
-    )
+    content, expected_output = file_setup(md_file=md_name, output_file=expected_name)
 
     # Call the function, processing Markdown with placeholders
-    result = FileBlockInsertReplacer(bold='', auto_break=False).update(content)
+    result = FileBlockInsertReplacer(bold=bold, auto_break=auto_break).update(content)
 
     # Assert that the result matches the expected output
-    assert expected_output == result, f"Output did not match:\n{result}"
+    assert result == expected_output, f"Output did not match for {md_name}"
 
 @pytest.mark.parametrize("lang, code_ext", [
     ("junk", "junk"),
@@ -114,7 +54,7 @@ def test_update_markdown_python_file():
     ("python", "py"),
 
 ])
-def test_update_markdown_code_file(lang, code_ext):
+def test_update_markdown_code_file(lang, code_ext, file_setup, default_replacer):
     """
     Test the update_markdown_file function using parameterized Markdown and code files
     for multiple languages.
@@ -128,10 +68,10 @@ def test_update_markdown_code_file(lang, code_ext):
     )
 
     # Call the function, processing Markdown with placeholders
-    result = FileBlockInsertReplacer(bold='', auto_break=False).update(content)
+    result = default_replacer.update(content)
 
     # Assert that the result matches the expected output
-    assert expected_output == result, f"Output did not match for {lang}:\n{result}"
+    assert result == expected_output, f"Output did not match for {lang}"
 
 def test_file_not_found_error():
     """
@@ -153,21 +93,21 @@ def test_file_not_found_error():
 @pytest.mark.parametrize("input_md_filename", [
     "input/example_python_glob.md",  # First test case
     "input/example_python_glob_insert.md",  # Add more cases as needed
-])
-def test_glob_pattern_in_file_inserts(input_md_filename):
+], ids=["glob", "glob_insert"])
+def test_glob_pattern_in_file_inserts(input_md_filename, cached_read):
     """
     Test that glob patterns in file insertion tags work correctly,
     matching multiple files according to the pattern.
     """
 
     # Convert the filename into a Path object
-    input_md = pathlib.Path(input_md_filename)
+    input_md = TEST_DIR / input_md_filename
 
     # Check if the test file exists
     assert input_md.exists(), f"Input file {input_md_filename} does not exist."
 
     # Create a test Markdown content with a glob pattern
-    markdown_content = input_md.read_text()
+    markdown_content = cached_read(input_md_filename)
 
     # Process the file insertions
     result = update_markdown_from_string(markdown_content, "", False)
@@ -176,26 +116,23 @@ def test_glob_pattern_in_file_inserts(input_md_filename):
     # Base assertions for all test cases
     assert "```python" in result, "Python code block not found in result"
 
-def test_bad_glob_pattern_error_message():
+def test_bad_glob_pattern_error_message(cached_read):
     """
     Test that when a glob pattern doesn't match any files, an appropriate
     error message is included in the output.
     """
-    # Create a Path object for the input file
-    input_md = pathlib.Path("input/example_python_bad_glob.md")
-
     # Read the Markdown content from the file
-    markdown_content = input_md.read_text()
+    markdown_content = cached_read("input/example_python_bad_glob.md")
 
     # Process the file insertions
     result = update_markdown_from_string(markdown_content, "", False)
 
     # Verify that the error message is included in the result
-    expected_error = f"<!-- No files found matching pattern 'input/XFAF*.py' -->"
+    expected_error = "<!-- No files found matching pattern 'input/XFAF*.py' -->"
     assert expected_error in result, "Error message for no matching files not found in result"
 
     # Verify that the original tags are preserved
-    assert f'<!--file "input/XFAF*.py"-->' in result, "Original file tag not preserved"
+    assert '<!--file "input/XFAF*.py"-->' in result, "Original file tag not preserved"
     assert "<!--file end-->" in result, "End file tag not preserved"
 
     # Make sure no Python code block was included (since no files matched)
@@ -1,65 +1,78 @@
 import importlib
+import os
 import pathlib
 
-from typer.testing import CliRunner
+import pytest
+
 from main import app
+from md_updater import update_markdown_file
 
-runner = CliRunner()
+def _fast_write(path: pathlib.Path, data: bytes) -> None:
+    """Write a small file with a single open/write/close."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
 
-def test_update_file_from_another_file():
-    """Tests the convert CLI functionality for updating a Markdown file from another text file.
 
-    This test verifies that the convert command correctly processes a Markdown file containing
-    file reference markers and updates the content between those markers with the content from
-    the referenced text file, formatted as a code block.
+@pytest.fixture
+def tmp_cwd(tmp_path: pathlib.Path, monkeypatch) -> pathlib.Path:
+    """
+    Run the test with tmp_path as the CWD, restored by monkeypatch afterwards.
 
-    The test creates temporary test files, runs the CLI command, and verifies the output
-    matches the expected result with the content properly inserted between markers.
+    The CLI reads mdfile.json and pyproject.toml relative to the CWD, so this keeps
+    CLI tests from seeing (or writing) anything in the real working directory.
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
 
-    No arguments are needed as the test creates and manages its own test files.
 
-    Raises:
-        AssertionError: If the CLI command fails or if the output content doesn't match
-            the expected result.
+@pytest.fixture
+def md_txt_pair(tmp_cwd: pathlib.Path) -> tuple[pathlib.Path, pathlib.Path]:
     """
-    try:
-        # Paths for the Markdown file and the input text file
-        md_file_path = pathlib.Path("123_test.md")
-        input_file_path = pathlib.Path("123_test.txt")
+    Create 123_test.md (with an empty file block) and 123_test.txt in the temporary CWD.
 
-        # Write initial content to the Markdown file
-        md_file_content = f'<!--file "123_test.txt"-->\n<!--file end-->'
-        md_file_path.write_text(md_file_content)
+    Running from that directory lets the relative file reference in the Markdown resolve.
+    """
+    md_file_path = tmp_cwd / "123_test.md"
+    input_file_path = tmp_cwd / "123_test.txt"
 
-        # Write initial content to the input text file
-        input_file_content = "Hello\nWorld"
-        input_file_path.write_text(input_file_content)
+    _fast_write(md_file_path, b'<!--file "123_test.txt"-->\n<!--file end-->')
+    _fast_write(input_file_path, b"Hello\nWorld")
 
-        # Ensure the paths are present
-        assert md_file_path.exists(), "Markdown file does not exist."
-        assert input_file_path.exists(), "Input text file does not exist."
+    return md_file_path, input_file_path
 
-        # Run the Typer CLI app with the `convert` command
-        # Pass arguments in a single string with spaces instead of as separate items
-        result = runner.invoke(app, [str(md_file_path)])
 
-        # Expected content of the updated Markdown file
-        expected_md_file_content = f'<!--file "123_test.txt"-->\n```\nHello\nWorld\n```\n<!--file end-->'
+def test_update_file_from_another_file(md_txt_pair):
+    """Tests updating a Markdown file in place from another text file.
 
-        # Verify the CLI executed successfully
-        assert result.exit_code == 0, f"CLI failed: {result.output}"
+    This test verifies that update_markdown_file correctly processes a Markdown file containing
+    file reference markers and updates the content between those markers with the content from
+    the referenced text file, formatted as a code block.
 
-        # Verify the file content has been updated correctly
-        updated_content = md_file_path.read_text()
-        assert updated_content == expected_md_file_content, (
-            f"Expected content:\n{expected_md_file_content}\nGot:\n{updated_content}"
-        )
-    finally:
-        md_file_path.unlink(missing_ok=True)
-        input_file_path.unlink(missing_ok=True)
+    The library function is called directly; the CLI wrapper is covered by
+    test_update_file_with_output_flag.
+
+    Raises:
+        AssertionError: If the output content doesn't match the expected result.
+    """
+    md_file_path, input_file_path = md_txt_pair
+
+    # Update the Markdown file in place
+    update_markdown_file(str(md_file_path))
+
+    # Expected content of the updated Markdown file
+    expected_md_file_content = '<!--file "123_test.txt"-->\n```\nHello\nWorld\n```\n<!--file end-->'
 
+    # Verify the file content has been updated correctly
+    updated_content = md_file_path.read_text()
+    assert updated_content == expected_md_file_content, (
+        f"Expected content:\n{expected_md_file_content}\nGot:\n{updated_content}"
+    )
 
-def test_version_flag():
+
+def test_version_flag(runner):
     """
     Test the `--version` flag.
     """
@@ -73,78 +86,44 @@ def test_version_flag():
     assert "mdfile" in result.output
     assert importlib.metadata.version("mdfile") in result.output
 
-def test_update_file_with_output_flag():
+def test_update_file_with_output_flag(runner, md_txt_pair):
     """Tests the convert CLI functionality with the --output flag.
 
     This test verifies that the convert command correctly processes a Markdown file containing
     file reference markers and writes the updated content to a separate output file when the
     --output flag is used. The original input file should remain unchanged.
 
-    The test creates temporary test files, runs the CLI command with the --output flag,
-    and verifies both that the output file has the correct content and that the input file
-    remains unchanged.
+    The md/txt pair is created in a per-test temporary directory by the md_txt_pair fixture.
 
     Raises:
         AssertionError: If the CLI command fails, if the output content doesn't match
             the expected result, or if the original file is modified.
     """
+    md_file_path, input_file_path = md_txt_pair
+    output_file_path = md_file_path.with_name("123_test_output.md")
 
-    # Pre-initialize variables to None to prevent
-    md_file_path = None
-    input_file_path = None
-    output_file_path = None
-
-    try:
-        # Paths for the Markdown file, input text file, and output file
-        md_file_path = pathlib.Path("123_test.md")
-        input_file_path = pathlib.Path("123_test.txt")
-        output_file_path = pathlib.Path("123_test_output.md")
-
-        # Write initial content to the Markdown file
-        md_file_content = f"""<!--file "123_test.txt"-->\n<!--file end-->"""
-        md_file_path.write_text(md_file_content)
-
-        # Write initial content to the input text file
-        input_file_content = "Hello\nWorld"
-        input_file_path.write_text(input_file_content)
-
-        # Ensure the paths are present
-        assert md_file_path.exists(), "Markdown file does not exist."
-        assert input_file_path.exists(), "Input text file does not exist."
-
-        # Run the Typer CLI app with the `convert` command and output flag
-        result = runner.invoke(app, [
-            str(md_file_path),
-            '--output',
-            str(output_file_path)
-        ])
-
-        # Expected content of the updated Markdown file
-        expected_md_file_content = f"""<!--file "123_test.txt"-->\n```\nHello\nWorld\n```\n<!--file end-->"""
-
-        # Verify the CLI executed successfully
-        assert result.exit_code == 0, f"CLI failed: {result.output}"
-
-        # Verify the output file exists and has the correct content
-        assert output_file_path.exists(), f"Output file {output_file_path} was not created."
-        updated_content = output_file_path.read_text()
-        assert updated_content == expected_md_file_content, (
-            f"Expected content in output file:\n{expected_md_file_content}\nGot:\n{updated_content}"
-        )
+    # Run the Typer CLI app with the `convert` command and output flag
+    result = runner.invoke(app, [
+        str(md_file_path),
+        '--output',
+        str(output_file_path)
+    ])
 
-    finally:
-        # Clean up all created files, only if the variables are not None
-        if md_file_path is not None:
-            md_file_path.unlink(missing_ok=True)
-        if input_file_path is not None:
-            input_file_path.unlink(missing_ok=True)
-        if output_file_path is not None:
-            output_file_path.unlink(missing_ok=True)
+    # Expected content of the updated Markdown file
+    expected_md_file_content = """<!--file "123_test.txt"-->\n```\nHello\nWorld\n```\n<!--file end-->"""
 
+    # Verify the CLI executed successfully
+    assert result.exit_code == 0, f"CLI failed: {result.output}"
 
+    # Verify the output file exists and has the correct content
+    assert output_file_path.exists(), f"Output file {output_file_path} was not created."
+    updated_content = output_file_path.read_text()
+    assert updated_content == expected_md_file_content, (
+        f"Expected content in output file:\n{expected_md_file_content}\nGot:\n{updated_content}"
+    )
 
 
-def test_nonexistent_file_error():
+def test_nonexistent_file_error(runner, tmp_cwd):
     """
     Test that passing a nonexistent file triggers an error message and exits with code 1.
     """
@@ -156,7 +135,7 @@ def test_nonexistent_file_error():
     assert "Error: File 'nonexistent_file.md' does not exist." in result.stderr  # Check error message
 
 
-def test_missing_filename_error():
+def test_missing_filename_error(runner, tmp_cwd):
     """Test that an error is raised when no filename is provided."""
     result = runner.invoke(app, ["--no_json"])
 
@@ -164,7 +143,7 @@ def test_missing_filename_error():
     assert "Error: Please provide a Markdown file to process" in result.stderr
 
 
-def test_missing_filename_error_with_multiple_options():
+def test_missing_filename_error_with_multiple_options(runner, tmp_cwd):
     """Test that an error is raised when no filename is provided but multiple options are used."""
     result = runner.invoke(app, [
         "--output", "output.md",
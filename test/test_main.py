@@ -3,13 +3,7 @@ import os
 import pathlib
 import random
 import string
-import sys
-
-# tomllib fallback for Python 3.10
-if sys.version_info < (3, 11):
-    import tomli as tomllib
-else:
-    pass
+from dataclasses import dataclass
 
 import pytest
 
@@ -18,31 +12,27 @@ from main import find_pyproject, load_pyproject_config  # adjust import
 
 
 @pytest.mark.parametrize(
-    "cli_cfg,json_cfg,toml_cfg,env_cfg,expected_update,desc",
+    "cli_cfg,json_cfg,toml_cfg,env_cfg,expected_update",
     [
         # Only defaults
-        (None, None, None, None, {}, "No sources, should return defaults"),
-        # JSON only
-        ({}, {"foo": "bar", "auto_break": False}, None, None, {"foo": "bar", "auto_break": False},
-         "JSON overrides defaults"),
+        (None, None, None, None, {}),
+        # JSON overrides defaults
+        ({}, {"foo": "bar", "auto_break": False}, None, None, {"foo": "bar", "auto_break": False}),
         # TOML overrides JSON
-        ({}, {"a": 1, "b": 2}, {"b": 3, "c": 4}, None, {"a": 1, "b": 3, "c": 4},
-         "TOML overrides JSON"),
-        # ENV overrides TOML
-        ({}, {"a": 1}, {"a": 2, "b": 3}, {"b": 4, "c": 5}, {"a": 2, "b": 4, "c": 5},
-         "ENV overrides TOML and JSON"),
-        # CLI overrides all
-        ({"c": 7, "d": 8}, {"a": 1}, {"b": 2, "c": 3}, {"c": 4}, {"a": 1, "b": 2, "c": 7, "d": 8},
-         "CLI overrides everything"),
-        # None values are skipped
-        ({"a": None}, {"b": 2, "c": None}, {"c": None}, {"d": None}, {"b": 2},
-         "None values are ignored"),
-        # Empty dicts
-        ({}, {}, {}, {}, {}, "Empty dicts do not alter defaults"),
-    ]
+        ({}, {"a": 1, "b": 2}, {"b": 3, "c": 4}, None, {"a": 1, "b": 3, "c": 4}),
+        # ENV overrides TOML and JSON
+        ({}, {"a": 1}, {"a": 2, "b": 3}, {"b": 4, "c": 5}, {"a": 2, "b": 4, "c": 5}),
+        # CLI overrides everything
+        ({"c": 7, "d": 8}, {"a": 1}, {"b": 2, "c": 3}, {"c": 4}, {"a": 1, "b": 2, "c": 7, "d": 8}),
+        # None values are ignored
+        ({"a": None}, {"b": 2, "c": None}, {"c": None}, {"d": None}, {"b": 2}),
+        # Empty dicts do not alter defaults
+        ({}, {}, {}, {}, {}),
+    ],
+    ids=["no_sources", "json_only", "toml_over_json", "env_over_toml", "cli_over_all", "skip_none", "empty"],
 )
 def test_merge_config_dicts_param(
-        cli_cfg, json_cfg, toml_cfg, env_cfg, expected_update, desc
+        cli_cfg, json_cfg, toml_cfg, env_cfg, expected_update
 ):
     """Parametrized thorough test of merge_config_dicts."""
     result = merge_config_dicts(cli_cfg=cli_cfg or {},
@@ -52,43 +42,43 @@ def test_merge_config_dicts_param(
     expected = DEFAULT_CONFIG.copy()
     expected.update(expected_update)
 
-    assert result == expected, f"{desc}: expected {expected}, got {result}"
-
-
-def random_key(length=5):
-    return "".join(random.choices(string.ascii_lowercase, k=length))
-
+    assert result == expected, f"expected {expected}, got {result}"
 
-def random_value():
-    # Mix of ints, strings, booleans, and None
-    return random.choice([
-        random.randint(0, 100),
-        random.random(),
-        random.choice([True, False]),
-        "".join(random.choices(string.ascii_letters, k=5)),
-        None
-    ])
 
+def random_key(rng: random.Random, length=5) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=length))
 
-def random_key(length=5) -> str:
-    return "".join(random.choices(string.ascii_lowercase, k=length))
 
-
-def random_value() -> any:
+def random_value(rng: random.Random) -> any:
     """Generate a random value that can appear in config dicts."""
     # Include int, float, bool, string, and None to test edge cases
     choices = [
-        random.randint(0, 100),
-        random.random(),
-        random.choice([True, False]),
-        "".join(random.choices(string.ascii_letters, k=5)),
+        rng.randint(0, 100),
+        rng.random(),
+        rng.choice([True, False]),
+        "".join(rng.choices(string.ascii_letters, k=5)),
         None  # explicitly include None to test that None does not overwrite
     ]
-    return random.choice(choices)
+    return rng.choice(choices)
+
 
+def random_config_sources(seed: int) -> tuple[dict, dict, dict, dict]:
+    """Generate random (cli, json, toml, env) config dicts from a fixed seed."""
+    rng = random.Random(seed)
+    return tuple(
+        {random_key(rng): random_value(rng) for _ in range(rng.randint(1, 5))}
+        for _ in range(4)
+    )
 
-@pytest.mark.parametrize("seed", range(5))  # 5 different random seeds
-def test_merge_config_dicts_fuzz(seed: int):
+
+# Fuzz inputs are generated once at import rather than inside every test run
+_FUZZ_CASES = tuple(
+    pytest.param(*random_config_sources(seed), id=f"seed{seed}") for seed in range(5)
+)
+
+
+@pytest.mark.parametrize("cli_cfg, json_cfg, toml_cfg, env_cfg", _FUZZ_CASES)
+def test_merge_config_dicts_fuzz(cli_cfg: dict, json_cfg: dict, toml_cfg: dict, env_cfg: dict):
     """
     Fuzz test merge_config_dicts with random dicts for each source.
 
@@ -98,14 +88,6 @@ def test_merge_config_dicts_fuzz(seed: int):
     - Check that defaults are preserved when missing in all sources.
     - Test that arbitrary combinations of types are handled correctly.
     """
-    random.seed(seed)
-
-    # Generate random dictionaries for each config source
-    cli_cfg = {random_key(): random_value() for _ in range(random.randint(1, 5))}
-    json_cfg = {random_key(): random_value() for _ in range(random.randint(1, 5))}
-    toml_cfg = {random_key(): random_value() for _ in range(random.randint(1, 5))}
-    env_cfg = {random_key(): random_value() for _ in range(random.randint(1, 5))}
-
     result = merge_config_dicts(cli_cfg=cli_cfg,
                                 json_cfg=json_cfg,
                                 toml_cfg=toml_cfg,
@@ -160,8 +142,8 @@ def test_merge_config_files(tmp_path: pathlib.Path, monkeypatch,
     # --- Set environment variable ---
     monkeypatch.setenv("MD_FILE_ENV", "env_val")
 
-    # --- Change working directory to tmp_path ---
-    os.chdir(tmp_path)
+    # --- Change working directory to tmp_path (restored by monkeypatch) ---
+    monkeypatch.chdir(tmp_path)
 
     # --- Run merge ---
     cfg = merge_config_files(
@@ -181,35 +163,57 @@ def test_merge_config_files(tmp_path: pathlib.Path, monkeypatch,
     # (not required but can be added if you want)
 
 
+@dataclass(frozen=True)
+class PyprojectTree:
+    """Paths of a small directory tree with a pyproject.toml one level down."""
+    root: pathlib.Path
+    level1: pathlib.Path
+    level2: pathlib.Path
+    pyproject_path: pathlib.Path
+
+
+@pytest.fixture(scope="module")
+def pyproject_tree(tmp_path_factory) -> PyprojectTree:
+    """
+    Build root/level1/level2 with root/level1/pyproject.toml, once per module.
+
+    The pyproject tests only read from this tree, so it is safe to share.
+    """
+    root = tmp_path_factory.mktemp("pyproject")
+    level1 = root / "level1"
+    level2 = level1 / "level2"
+    level2.mkdir(parents=True)
+
+    pyproject_path = level1 / "pyproject.toml"
+    pyproject_path.write_text(
+        "[tool.mdfile]\nfile_name = 'example.md'\nauto_break = false\n",
+        encoding="utf8"
+    )
+    return PyprojectTree(root, level1, level2, pyproject_path)
+
+
 # -----------------------------
 # Test 1: Finding the pyproject.toml
 # -----------------------------
 
-def test_find_pyproject(tmp_path: pathlib.Path):
+def test_find_pyproject(pyproject_tree: PyprojectTree, monkeypatch):
     """
     Verify that find_pyproject finds the pyproject.toml in the current or parent directories.
     """
 
-    # Create nested directories
-    level1 = tmp_path / "level1"
-    level1.mkdir()
-    level2 = level1 / "level2"
-    level2.mkdir()
-
-    # Create pyproject.toml in level1
-    pyproject_file = level1 / "pyproject.toml"
-    pyproject_file.write_text("[tool.mdfile]\ntest_key = 'test_val'\n", encoding="utf8")
+    # Run from outside the tree so an explicit start must not depend on CWD
+    monkeypatch.chdir(pyproject_tree.root.parent)
 
     # Case: start from subdirectory → should find file in parent
-    found = find_pyproject(start=level2)
-    assert found == pyproject_file
+    found = find_pyproject(start=pyproject_tree.level2)
+    assert found == pyproject_tree.pyproject_path
 
     # Case: start from same directory → should find file
-    found_self = find_pyproject(start=level1)
-    assert found_self == pyproject_file
+    found_self = find_pyproject(start=pyproject_tree.level1)
+    assert found_self == pyproject_tree.pyproject_path
 
     # Case: start from above → should not find file
-    found_none = find_pyproject(start=tmp_path)
+    found_none = find_pyproject(start=pyproject_tree.root)
     assert found_none is None
 
 
@@ -217,25 +221,37 @@ def test_find_pyproject(tmp_path: pathlib.Path):
 # Test 2: Reading pyproject.toml content
 # -----------------------------
 
-def test_load_pyproject_config(tmp_path: pathlib.Path):
+def test_load_pyproject_config(pyproject_tree: PyprojectTree, monkeypatch):
     """
     Verify that load_pyproject_config reads the [tool.mdfile] section correctly.
     """
 
-    # Create a pyproject.toml in tmp_path
-    pyproject_file = tmp_path / "pyproject.toml"
-    pyproject_file.write_text(
-        "[tool.mdfile]\nfile_name = 'example.md'\nauto_break = false\n",
-        encoding="utf8"
-    )
+    # Run from outside the tree so an explicit path must not depend on CWD
+    monkeypatch.chdir(pyproject_tree.root.parent)
 
     # Load config directly using the path
-    config = load_pyproject_config(pyproject_file)
+    config = load_pyproject_config(pyproject_tree.pyproject_path)
     assert isinstance(config, dict)
     assert config.get("file_name") == "example.md"
     assert config.get("auto_break") is False
 
     # Case: no file → should return empty dict
-    non_existent_file = tmp_path / "does_not_exist.toml"
+    non_existent_file = pyproject_tree.root / "does_not_exist.toml"
     empty_config = load_pyproject_config(non_existent_file)
     assert empty_config == {}
+
+
+def test_load_pyproject_config_rereads_edited_file(tmp_path):
+    """
+    Verify that an edited pyproject.toml is parsed again rather than served from cache.
+    """
+    pyproject_path = tmp_path / "pyproject.toml"
+    pyproject_path.write_text('[tool.mdfile]\nfile_name = "old.md"\n')
+    assert load_pyproject_config(pyproject_path).get("file_name") == "old.md"
+
+    # Rewrite with different content and bump the mtime so coarse timestamps can't mask the edit
+    st = pyproject_path.stat()
+    pyproject_path.write_text('[tool.mdfile]\nfile_name = "newer.md"\n')
+    os.utime(pyproject_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert load_pyproject_config(pyproject_path).get("file_name") == "newer.md"
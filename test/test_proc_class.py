@@ -1,13 +1,22 @@
+import os
+import re
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-import textwrap
+import updater.process
 from updater.process import ProcessReplacer,ProcessBlockReplacer
 from updater.process import ShellBlockReplacer,ShellReplacer
 
 
 
 
-def test_update_process_command():
+def test_update_process_command(json_config_dir, monkeypatch):
     """Test that process commands are executed and their output is inserted."""
+    # Run ls in a known directory rather than whatever the CWD happens to be
+    monkeypatch.chdir(json_config_dir)
+
     # Test input with process placeholder
     test_input = """<!--process "ls"-->\n<!--process end-->"""
 
@@ -27,28 +36,35 @@ def test_update_process_command():
     assert lines[-1] == "<!--process end-->"
     # There should be atleast an input.  This is pretty crude in that it just checks that
     # some "stuff" is in the output rather than the exact "stuff"
-    assert 'mdfile.json' in lines
-
+    line_set = set(lines)
+    assert 'mdfile.json' in line_set
+
+
+
+@pytest.fixture(scope="module")
+def cat_target_file(tmp_path_factory):
+    """Static Python file for the cat tests, written once per module."""
+    test_file = tmp_path_factory.mktemp("cat") / "test_mnm.py"
+    file_content = "\n".join([
+        "def test_update_file_from_another_file(): pass",
+        "def test_update_file_with_output_flag(): pass",
+        "def test_update_markdown_csv_file(): pass",
+        "def test_update_markdown_csv_br_file(): pass",
+        "def test_update_markdown_python_file(): pass",
+        "def test_update_markdown_code_file(): pass",
+        "def test_csv_to_markdown_file_not_found(): pass",
+        "def test_update_process_command(): pass",
+    ])
+    test_file.write_text(file_content)
+    return test_file
 
 
-def test_process_cat_verifies_function_declarations(tmp_path):
+def test_process_cat_verifies_function_declarations(cat_target_file):
     """
     Test that executes a 'cat <tempfile>' command through the process insertion
     and verifies that expected function declarations are present in the result.
     """
-    # Create a temporary Python file with known content
-    test_file = tmp_path / "test_mnm.py"
-    file_content = textwrap.dedent("""
-        def test_update_file_from_another_file(): pass
-        def test_update_file_with_output_flag(): pass
-        def test_update_markdown_csv_file(): pass
-        def test_update_markdown_csv_br_file(): pass
-        def test_update_markdown_python_file(): pass
-        def test_update_markdown_code_file(): pass
-        def test_csv_to_markdown_file_not_found(): pass
-        def test_update_process_command(): pass
-    """).strip()
-    test_file.write_text(file_content)
+    test_file = cat_target_file
 
     # Input content with process placeholder for cat command
     test_input = f"""<!--process "cat {test_file}"-->\n<!--process end-->"""
@@ -57,19 +73,22 @@ def test_process_cat_verifies_function_declarations(tmp_path):
     pbr = ProcessBlockReplacer()
     result = pbr.update(test_input)
 
-    # Verify each expected function declaration is present in the output
-    expected_functions = [
-        "def test_update_file_from_another_file",
-        "def test_update_file_with_output_flag",
-        "def test_update_markdown_csv_file",
-        "def test_update_markdown_csv_br_file",
-        "def test_update_markdown_python_file",
-        "def test_update_markdown_code_file",
-        "def test_csv_to_markdown_file_not_found",
-        "def test_update_process_command",
+    # Verify each expected function declaration is present in the output,
+    # collecting all of them in a single regex pass over the result
+    expected_names = [
+        "test_update_file_from_another_file",
+        "test_update_file_with_output_flag",
+        "test_update_markdown_csv_file",
+        "test_update_markdown_csv_br_file",
+        "test_update_markdown_python_file",
+        "test_update_markdown_code_file",
+        "test_csv_to_markdown_file_not_found",
+        "test_update_process_command",
     ]
-    for func_decl in expected_functions:
-        assert func_decl in result, f"Function declaration '{func_decl}' not found in cat output"
+    pattern = re.compile(r"def (" + "|".join(map(re.escape, expected_names)) + r")\b")
+    found = set(pattern.findall(result))
+    missing = set(expected_names) - found
+    assert not missing, f"Function declarations not found in cat output: {sorted(missing)}"
 
     # Verify placeholder structure is intact
     assert result.startswith(f"""<!--process "cat {test_file}"-->\n""")
@@ -84,11 +103,11 @@ def test_process_replacer_cat(tmp_path):
     """
     # Create a temporary file with known content
     test_file = tmp_path / "test_file.py"
-    file_content = textwrap.dedent("""
-        def foo(): pass
-        def bar(): pass
-        def baz(): pass
-    """).strip()
+    file_content = "\n".join([
+        "def foo(): pass",
+        "def bar(): pass",
+        "def baz(): pass",
+    ])
     test_file.write_text(file_content)
 
     # Input content with the process placeholder
@@ -109,39 +128,130 @@ def test_process_replacer_cat(tmp_path):
 
 
 
-@pytest.mark.parametrize(
-    "cls,test_input",
-    [
-        (
-            ProcessBlockReplacer,
-            """<!--process "sleep 5"-->\n<!--process end-->"""
-        ),
-        (
-            ProcessReplacer,
-            r"""{{process "sleep 5"}}"""
-        ),
-        (
-                ShellBlockReplacer,
-                """<!--shell "sleep 5"-->\n<!--shell end-->"""
-        ),
-        (
-                ShellReplacer,
-                r"""{{shell "sleep 5"}}"""
-        ),
-    ],
-)
-def test_process_command_timeout(cls, test_input):
+# (replacer class, input, expected header, expected footer) for a command that times out
+_TIMEOUT_CASES = [
+    (
+        ProcessBlockReplacer,
+        """<!--process "sleep 5"-->\n<!--process end-->""",
+        """<!--process "sleep 5"-->""",
+        "<!--process end-->",
+    ),
+    (
+        ProcessReplacer,
+        r"""{{process "sleep 5"}}""",
+        """<!--process "sleep 5"-->""",
+        "<!--process end-->",
+    ),
+    (
+        ShellBlockReplacer,
+        """<!--shell "sleep 5"-->\n<!--shell end-->""",
+        """<!--shell "sleep 5"-->""",
+        "<!--shell end-->",
+    ),
+    (
+        ShellReplacer,
+        r"""{{shell "sleep 5"}}""",
+        """<!--shell "sleep 5"-->""",
+        "<!--shell end-->",
+    ),
+]
+
+
+@pytest.mark.parametrize("cls,test_input,header,footer", _TIMEOUT_CASES)
+def test_process_command_timeout(cls, test_input, header, footer, monkeypatch):
     """
     Verify process insertion handles timeout errors for different replacer classes.
+
+    The command runner is replaced by a stub that raises TimeoutExpired immediately, so
+    the formatting path is exercised without waiting on a real timeout.  The real
+    subprocess timeout is covered by the slow test below.
     """
 
-    # Run update with a short timeout so the sleep triggers failure
+    def _raise_timeout(args, timeout_sec):
+        raise subprocess.TimeoutExpired(cmd=args, timeout=timeout_sec)
+
+    monkeypatch.setattr(updater.process, "_run_command", _raise_timeout)
+
     result = cls(timeout_sec=1).update(content=test_input)
 
     # Common assertions
     assert "Timeout Error" in result, "Timeout error indication missing in result"
     assert "timed out after 1 seconds" in result, "Specific timeout duration missing"
-    assert True
+
+    # Timed-out commands are wrapped in comment markers
+    assert result.startswith(header), "Process command header missing"
+    assert footer in result, "Process command footer missing"
+
+
+@pytest.mark.skipif(not hasattr(os, "killpg"), reason="process groups are POSIX-only")
+def test_process_command_timeout_kills_process_group():
+    """
+    Verify a timed-out command's children are killed along with it.
+
+    The backgrounded sleep inherits the output pipe, so if only the shell were
+    killed, collecting the output would block until the sleep finished.
+    """
+    test_input = """<!--process "sh -c 'sleep 5 & wait'"-->\n<!--process end-->"""
+
+    start = time.monotonic()
+    result = ProcessBlockReplacer(timeout_sec=0.2).update(content=test_input)
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 2, f"Timed-out command took {elapsed:.1f}s to return"
+    assert "Timeout Error" in result, "Timeout error indication missing in result"
+    assert "timed out after 0.2 seconds" in result, "Specific timeout duration missing"
+    assert result.startswith("""<!--process "sh -c 'sleep 5 & wait'"-->"""), "Process command header missing"
+    assert result.endswith("<!--process end-->"), "Process command footer missing"
+
+
+def test_run_command_interrupt_kills_child(monkeypatch):
+    """
+    Verify the command is killed if waiting on it is interrupted.
+
+    The command runs in its own session, so a terminal Ctrl-C never reaches it;
+    the interrupt in the parent must clean it up instead.
+    """
+    real_communicate = subprocess.Popen.communicate
+    pids = []
+
+    def interrupted_communicate(self, *args, **kwargs):
+        # Interrupt only the first wait; the cleanup's communicate() runs normally
+        if not pids:
+            pids.append(self.pid)
+            raise KeyboardInterrupt
+        return real_communicate(self, *args, **kwargs)
+
+    monkeypatch.setattr(subprocess.Popen, "communicate", interrupted_communicate)
+
+    with pytest.raises(KeyboardInterrupt):
+        updater.process._run_command(["sleep", "30"], timeout_sec=30)
+
+    # The child has been killed and reaped, so its pid no longer exists
+    with pytest.raises(ProcessLookupError):
+        os.kill(pids[0], 0)
+
+
+@pytest.mark.slow
+def test_process_command_timeout_real_subprocess():
+    """
+    Verify a real long-running command is cut off by the timeout for every replacer.
+
+    The cases only wait on wall-clock time, so they run concurrently and the whole
+    test takes about one timeout.  Opt in with ``-m slow``.
+    """
+    with ThreadPoolExecutor(max_workers=len(_TIMEOUT_CASES)) as pool:
+        futures = [
+            pool.submit(cls(timeout_sec=0.2).update, content=test_input)
+            for cls, test_input, _, _ in _TIMEOUT_CASES
+        ]
+        results = [future.result() for future in futures]
+
+    for (cls, _, header, footer), result in zip(_TIMEOUT_CASES, results):
+        name = cls.__name__
+        assert "Timeout Error" in result, f"{name}: timeout error indication missing in result"
+        assert "timed out after 0.2 seconds" in result, f"{name}: specific timeout duration missing"
+        assert result.startswith(header), f"{name}: process command header missing"
+        assert footer in result, f"{name}: process command footer missing"
 
 
 @pytest.mark.parametrize(
@@ -169,7 +279,7 @@ def test_shell_replacers_basic_output(replacer_class, placeholder, expected):
     replacer = replacer_class(timeout_sec=5)  # short timeout for test
     result = replacer.update(placeholder)
 
-    # Check that the output starts with the expected shell block prefix
+    # Check the whole rendered block
     assert result == expected
 
 
@@ -1,5 +1,4 @@
 import pytest
-from typing import Optional
 
 # Import the function to test
 # Assuming it's in a module like str_utils
@@ -1,6 +1,10 @@
 import pytest
 from mdfile.updater.validator import Tokenizer, Token, Validator
 
+# Shared across cases: Tokenizer is stateless and Validator resets on each validate()
+_TOKENIZER = Tokenizer()
+_VALIDATOR = Validator()
+
 @pytest.mark.parametrize(
     "text, expected",
     [
@@ -81,8 +85,7 @@ from mdfile.updater.validator import Tokenizer, Token, Validator
     ],
 )
 def test_tokenizer_edge_cases(text, expected):
-    tokenizer = Tokenizer()
-    tokens = list(tokenizer.tokenize(text))
+    tokens = list(_TOKENIZER.tokenize(text))
     assert tokens == expected
 
 
@@ -106,8 +109,8 @@ def test_tokenizer_edge_cases(text, expected):
     ],
 )
 def test_validator_valid(doc):
-    tokens = list(Tokenizer().tokenize(doc))
-    assert Validator().validate(tokens) is True
+    tokens = list(_TOKENIZER.tokenize(doc))
+    assert _VALIDATOR.validate(tokens) is True
 
 
 @pytest.mark.parametrize(
@@ -178,9 +181,66 @@ def test_validator_valid(doc):
 )
 def test_validator_invalid(doc, errmsg, desc):
     """Test invalid Markdown block structures and nesting issues."""
-    tokens = list(Tokenizer().tokenize(doc))
-    validator = Validator()
+    tokens = list(_TOKENIZER.tokenize(doc))
     with pytest.raises(ValueError) as exc:
-        validator.validate(tokens)
+        _VALIDATOR.validate(tokens)
     assert errmsg in str(exc.value.args[0]), f"Failed: {desc}"
 
+
+
+def test_validator_reusable_after_error():
+    """A Validator left mid-block by an error must validate the next stream from scratch."""
+    validator = Validator()
+    with pytest.raises(ValueError):
+        validator.validate(_TOKENIZER.tokenize('<!-- shell "a" -->'))
+    doc = '<!-- file "b.txt" -->\ndata\n<!-- file end -->'
+    assert validator.validate(_TOKENIZER.tokenize(doc)) is True
+
+
+# A grammar that also accepts "run" as an alias for process blocks
+_RUN_GRAMMAR = Tokenizer.TAG_RE.replace("(shell|file|process)", "(shell|file|process|run)")
+
+
+class _RunTokenizer(Tokenizer):
+    TAG_RE = _RUN_GRAMMAR
+
+
+# A grammar that marks tags with [[ ]] instead of HTML comments
+_BRACKET_GRAMMAR = Tokenizer.TAG_RE.replace("<!--", r"\[\[").replace("-->", r"\]\]")
+
+_RUN_TEXT = '<!-- run "ls" -->\n<!-- run end -->'
+_RUN_TOKENS = [Token("START", "run", '"ls"', 1), Token("END", "run", None, 2)]
+
+
+@pytest.mark.parametrize(
+    "tokenizer, text, expected",
+    [
+        (Tokenizer(grammar=_RUN_GRAMMAR), _RUN_TEXT, _RUN_TOKENS),
+        (_RunTokenizer(), _RUN_TEXT, _RUN_TOKENS),
+        # Lines that don't open an HTML comment must still reach a custom grammar
+        (
+            Tokenizer(grammar=_BRACKET_GRAMMAR),
+            '<!-- note -->\n[[ shell "ls" ]]\n[[ shell end ]]',
+            [
+                Token("TEXT", "text", "<!-- note -->", 1),
+                Token("START", "shell", '"ls"', 2),
+                Token("END", "shell", None, 3),
+            ],
+        ),
+        # A document with no HTML comment at all must still be tokenized
+        (
+            Tokenizer(grammar=_BRACKET_GRAMMAR),
+            '[[ shell "ls" ]]\nls\n[[ shell end ]]',
+            [
+                Token("START", "shell", '"ls"', 1),
+                Token("TEXT", "text", "ls", 2),
+                Token("END", "shell", None, 3),
+            ],
+        ),
+    ],
+)
+def test_tokenizer_custom_grammar(tokenizer, text, expected):
+    """Verify a grammar passed in or set on a subclass replaces the default."""
+    assert list(tokenizer.tokenize(text)) == expected
+    # The default grammar treats the custom tags as plain text
+    assert all(t.kind == "TEXT" for t in _TOKENIZER.tokenize(text))
@@ -1,11 +1,6 @@
-import os
-import tempfile
-import json
 import pytest
 from mdfile.updater.variables import VariableReplacer
 
-import pytest
-
 
 FIELDS = [
     "name",
@@ -25,14 +20,20 @@ FIELDS = [
 ]
 
 
-@pytest.mark.parametrize("field", FIELDS)
-def test_default_matches_explicit(field):
-    replacer = VariableReplacer()
-    default_var = f"$meta.{field}"
-    explicit_var = f"$meta.mdfile.{field}"
+@pytest.fixture(scope="module")
+def replacer():
+    """Shared default VariableReplacer for tests that only read package metadata."""
+    return VariableReplacer()
+
+
+# (field, default-package placeholder, explicit mdfile placeholder), built once at import
+META_CASES = [(f, f"{{{{$meta.{f}}}}}", f"{{{{$meta.mdfile.{f}}}}}") for f in FIELDS]
+
 
-    def_val = replacer.update(f"{{{{{default_var}}}}}")
-    exp_val = replacer.update(f"{{{{{explicit_var}}}}}")
+@pytest.mark.parametrize("field,default,explicit", META_CASES, ids=FIELDS)
+def test_default_matches_explicit(field, default, explicit, replacer):
+    def_val = replacer.update(default)
+    exp_val = replacer.update(explicit)
     assert def_val == exp_val, f"Mismatch for field '{field}' vs default from meta"
 
 
@@ -74,42 +75,46 @@ def test_env_missing(monkeypatch, ):
     assert "ERROR: Variable" in result
 
 
+# (content, expected, description) for placeholders with assorted spacing
+SPACING_CASES = [
+    # USER variations
+    ("Hello {{$USER}}!", "Hello alice!", "no extra spacing"),
+    ("Hello {{   $USER}}!", "Hello alice!", "leading spaces before var"),
+    ("Hello {{$USER   }}!", "Hello alice!", "trailing spaces after var"),
+    ("Hello {{   $USER   }}!", "Hello alice!", "both leading and trailing spaces"),
+    ("Hello {{\t$USER}}!", "Hello alice!", "leading tab before var"),
+    ("Hello {{$USER\t}}!", "Hello alice!", "trailing tab after var"),
+    ("Hello {{\t$USER\t}}!", "Hello alice!", "tabs around var"),
+
+    # PROJECT variations
+    ("Hi {{$PROJECT}}!", "Hi pytest_demo!", "no extra spacing project"),
+    ("Hi {{   $PROJECT   }}!", "Hi pytest_demo!", "spaces around project"),
+    ("Hi {{\t$PROJECT\t}}!", "Hi pytest_demo!", "tabs around project"),
+
+    # Both variables together
+    (
+        "User={{   $USER   }}, Project={{\t$PROJECT\t}}",
+        "User=alice, Project=pytest_demo",
+        "multiple variables with mixed spacing"
+    ),
+]
 
-import pytest
 
-def test_spacing_variations_parametric():
-    replacer = VariableReplacer(extra_vars={"USER": "alice", "PROJECT": "pytest_demo"})
-
-    test_cases = [
-        # USER variations
-        ("Hello {{$USER}}!", "Hello alice!", "no extra spacing"),
-        ("Hello {{   $USER}}!", "Hello alice!", "leading spaces before var"),
-        ("Hello {{$USER   }}!", "Hello alice!", "trailing spaces after var"),
-        ("Hello {{   $USER   }}!", "Hello alice!", "both leading and trailing spaces"),
-        ("Hello {{\t$USER}}!", "Hello alice!", "leading tab before var"),
-        ("Hello {{$USER\t}}!", "Hello alice!", "trailing tab after var"),
-        ("Hello {{\t$USER\t}}!", "Hello alice!", "tabs around var"),
-
-        # PROJECT variations
-        ("Hi {{$PROJECT}}!", "Hi pytest_demo!", "no extra spacing project"),
-        ("Hi {{   $PROJECT   }}!", "Hi pytest_demo!", "spaces around project"),
-        ("Hi {{\t$PROJECT\t}}!", "Hi pytest_demo!", "tabs around project"),
-
-        # Both variables together
-        (
-            "User={{   $USER   }}, Project={{\t$PROJECT\t}}",
-            "User=alice, Project=pytest_demo",
-            "multiple variables with mixed spacing"
-        ),
-    ]
+@pytest.fixture(scope="module")
+def user_project_replacer():
+    """Shared VariableReplacer with USER and PROJECT set."""
+    return VariableReplacer(extra_vars={"USER": "alice", "PROJECT": "pytest_demo"})
 
-    @pytest.mark.parametrize("content,expected,desc", test_cases)
-    def _run(content: str, expected: str, desc: str) -> None:
-        result = replacer.update(content)
-        assert result == expected, f"Failed: {desc}"
 
-    for content, expected, desc in test_cases:
-        _run(content, expected, desc)
+@pytest.mark.parametrize(
+    "content,expected,desc",
+    SPACING_CASES,
+    ids=[desc for _, _, desc in SPACING_CASES],
+)
+def test_spacing_variations_parametric(content, expected, desc, user_project_replacer):
+    result = user_project_replacer.update(content)
+    assert result == expected, f"Failed: {desc}"
+
 
 def test_no_vars_file():
     replacer = VariableReplacer()